@@ -6,6 +6,8 @@ documentation: https://www.sphinx-doc.org/en/master/usage/configuration.html
 
 from __future__ import annotations
 
+import os
+
 from sphinx_api_relink.helpers import (
     get_execution_mode,
     pin,
@@ -22,7 +24,17 @@ set_intersphinx_version_remapping({
     "matplotlib": {"3.5.1": "3.5.0"},
 })
 
-BRANCH = _get_commit_sha()
+
+def _get_commit_sha_from_env() -> str:
+    for variable in ("READTHEDOCS_GIT_COMMIT_HASH", "GITHUB_SHA"):
+        commit_sha = os.environ.get(variable)
+        if commit_sha:
+            return commit_sha[:7]
+    return _get_commit_sha()
+
+
+BRANCH = _get_commit_sha_from_env()
+EXECUTION_MODE = get_execution_mode()
 ORGANIZATION = "ComPWA"
 REPO_NAME = "compwa.github.io"
 REPO_TITLE = "ComPWA Organization"
@@ -78,15 +90,11 @@ extensions = [
     "sphinx.ext.todo",
     "sphinxcontrib.bibtex",
 ]
+if os.environ.get("SPHINX_BUILDER", "html") == "linkcheck":
+    _HTML_ONLY_EXTENSIONS = {"sphinx_comments", "sphinx_copybutton", "sphinx_thebe"}
+    extensions = [ext for ext in extensions if ext not in _HTML_ONLY_EXTENSIONS]
 graphviz_output_format = "svg"
-html_css_files = [
-    "https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.1.1/css/all.min.css",
-]
 html_favicon = "_static/favicon.ico"
-html_js_files = [
-    "https://cdn.datatables.net/1.13.6/js/jquery.dataTables.min.js",
-    "https://cdnjs.cloudflare.com/ajax/libs/require.js/2.3.4/require.min.js",
-]
 html_last_updated_fmt = "%-d %B %Y"
 html_logo = (
     "https://raw.githubusercontent.com/ComPWA/ComPWA/04e5199/doc/images/logo.svg"
@@ -184,7 +192,7 @@ myst_substitutions = {
     "remark_019": (
         "Notice how a new file [`019/Project.toml`](./019/Project.toml) and "
         " [`019/Manifest.toml`](./019/Manifest.toml) are automatically generated."
-        if get_execution_mode() != "off"
+        if EXECUTION_MODE != "off"
         else ""
     ),
     "run_interactive": f"""
@@ -200,7 +208,7 @@ nb_execution_excludepatterns = [
     "adr/001/*",
     "adr/002/*",
 ]
-nb_execution_mode = get_execution_mode()
+nb_execution_mode = EXECUTION_MODE
 nb_execution_show_tb = True
 nb_execution_timeout = -1
 nb_output_stderr = "remove"